@@ -1,10 +1,32 @@
 #!/usr/bin/env python3
 
 import json
+import mmap
 import os
 from pathlib import Path
 from typing import List, Dict, Any
 
+# Files smaller than this are read directly; mmap setup costs more than it saves
+MMAP_THRESHOLD = 4096
+
+def _walk_services(root: str, recursive: bool = True) -> List[str]:
+    """Collect .service file paths under root using os.scandir"""
+    found = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.service') and entry.is_file():
+                        found.append(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            # Missing or unreadable directories are skipped
+            continue
+    return found
+
 class Config:
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'systemdcontrol'
@@ -22,17 +44,21 @@ class Config:
         self.config = self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
-        if not self.config_file.exists():
-            return self.default_config.copy()
-        
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults to ensure all required keys exist
-                merged_config = self.default_config.copy()
-                merged_config.update(config)
-                return merged_config
-        except (json.JSONDecodeError, IOError):
+            with open(self.config_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                        config = json.loads(bytes(mm))
+                else:
+                    config = json.loads(f.read())
+            
+            # Merge with defaults to ensure all required keys exist
+            merged_config = self.default_config.copy()
+            merged_config.update(config)
+            return merged_config
+        except FileNotFoundError:
+            return self.default_config.copy()
+        except (json.JSONDecodeError, IOError, ValueError):
             return self.default_config.copy()
     
     def save_config(self) -> bool:
@@ -86,21 +112,25 @@ class Config:
         self.config = self.default_config.copy()
         return self.save_config()
     
+    def get_service_index(self) -> Dict[str, str]:
+        """Map service file names to their first match across the configured directories"""
+        index = {}
+        recursive = self.get_recursive_search()
+        
+        for dir_str in self.get_service_directories():
+            for service_file in _walk_services(os.path.abspath(dir_str), recursive):
+                index.setdefault(os.path.basename(service_file), service_file)
+        
+        return index
+    
     def get_all_service_files(self) -> List[Path]:
-        service_files = []
+        seen = set()
         directories = self.get_service_directories()
         recursive = self.get_recursive_search()
         
         for dir_str in directories:
-            dir_path = Path(dir_str)
-            if not dir_path.exists():
-                continue
-                
-            if recursive:
-                # Recursively find all .service files
-                service_files.extend(dir_path.rglob('*.service'))
-            else:
-                # Only direct children
-                service_files.extend(dir_path.glob('*.service'))
+            # Key on the resolved path so symlinked directories don't duplicate
+            for service_file in _walk_services(os.path.abspath(dir_str), recursive):
+                seen.add(os.path.realpath(service_file))
         
-        return list(set(service_files))  # Remove duplicates
\ No newline at end of file
+        return [Path(p) for p in seen]
\ No newline at end of file
@@ -1,57 +1,175 @@
 #!/usr/bin/env python3
 
-import argparse
+import functools
+import json
+import os
 import subprocess
 import sys
-import os
+import time
 from pathlib import Path
-import json
-from datetime import datetime, timedelta
+from types import SimpleNamespace
 import re
 from config import Config
 
+# argparse, datetime and concurrent.futures are imported lazily where used
+
+# Properties requested from `systemctl show` when batching status queries
+STATUS_PROPERTIES = ['Names', 'Description', 'ActiveState', 'SubState', 'UnitFileState',
+                     'MainPID', 'MemoryCurrent', 'StateChangeTimestamp']
+
+# Patterns for parsing `systemctl status` output (as bytes)
+_RE_SINCE = re.compile(rb'since (.+?)(?:;|$)')
+_RE_PID = re.compile(rb'Main PID: (\d+)')
+_RE_MEM = re.compile(rb'Memory: (.+?)(?:\s|$)')
+_UNIT_BULLET = '●'.encode()
+
+# `systemctl status` line handlers, keyed on the text before the first ':'
+def _handle_active(line, status_info):
+    status_info['active'] = b'active (running)' in line
+    since_match = _RE_SINCE.search(line)
+    if since_match:
+        status_info['since'] = since_match.group(1).strip().decode()
+    return 'active'
+
+def _handle_loaded(line, status_info):
+    status_info['enabled'] = b'enabled' in line
+    return 'loaded'
+
+def _handle_main_pid(line, status_info):
+    pid_match = _RE_PID.search(line)
+    if pid_match:
+        status_info['main_pid'] = pid_match.group(1).decode()
+        return 'main_pid'
+    return None
+
+def _handle_memory(line, status_info):
+    memory_match = _RE_MEM.search(line)
+    if memory_match:
+        status_info['memory'] = memory_match.group(1).decode()
+        return 'memory'
+    return None
+
+_STATUS_HANDLERS = {
+    b'Active': _handle_active,
+    b'Loaded': _handle_loaded,
+    b'Main PID': _handle_main_pid,
+    b'Memory': _handle_memory,
+}
+
+def _format_bytes(value):
+    """Format a byte count the way `systemctl status` prints memory usage"""
+    size = float(value)
+    for suffix in ['B', 'K', 'M', 'G', 'T']:
+        if size < 1024 or suffix == 'T':
+            break
+        size /= 1024
+    return f"{size:.0f}{suffix}" if suffix == 'B' else f"{size:.1f}{suffix}"
+
+def _parse_since(since_str):
+    """Parse a systemd timestamp like 'Mon 2024-01-01 10:00:00 UTC'"""
+    # Fixed format, so split by hand rather than using strptime
+    from datetime import datetime
+    
+    _, date_part, time_part = since_str.split(';')[0].split()[:3]
+    year, month, day = date_part.split('-')
+    hour, minute, second = time_part.split(':')
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+
+@functools.lru_cache(maxsize=512)
+def _since_epoch(since_str):
+    """Convert a systemd timestamp to epoch seconds, or None if it can't be parsed"""
+    if not since_str:
+        return None
+    try:
+        return int(_parse_since(since_str).timestamp())
+    except (ValueError, OverflowError):
+        return None
+
 class SystemdControl:
     def __init__(self):
         self.config = Config()
         self.reload_config()
     
     def reload_config(self):
-        """Reload configuration and update service paths"""
-        self.config = Config()
-        self.service_paths = [Path(p) for p in self.config.get_service_directories()]
+        """Rebuild service paths and lookup caches from the current configuration"""
+        # The config object is shared with the TUI, so it is not re-read here
+        self.service_paths = tuple(Path(p) for p in self.config.get_service_directories())
+        self.service_path_strs = tuple(sys.intern(str(p)) for p in self.service_paths)
+        # Literal and symlink-resolved directory prefixes for str.startswith
+        self._path_prefixes = tuple({os.path.join(form(p), '')
+                                     for p in self.service_path_strs
+                                     for form in (os.path.abspath, os.path.realpath)})
+        self._service_index = None
+        self._svc_cache = None
+    
+    def rebuild_service_index(self):
+        """Forget the service file index and list so both are rebuilt on next lookup"""
+        self._service_index = None
+        self._svc_cache = None
 
     def get_services(self, user_only=None):
         if user_only is None:
             user_only = self.config.get_user_services_only()
         
+        # Cached until a service directory changes; full listings always re-query
+        mtimes = []
+        for p in self.service_path_strs:
+            try:
+                mtimes.append(os.stat(p).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        mtime_key = (user_only,) + tuple(mtimes)
+        if self._svc_cache and self._svc_cache[0] == mtime_key:
+            if user_only:
+                return list(self._svc_cache[1])
+        elif self._svc_cache:
+            # Directories changed, so the file index may be stale too
+            self._service_index = None
+        
         services = []
+        for service_name in self._list_unit_files():
+            if user_only:
+                # Only include services in configured directories
+                service_file = self.find_service_file(service_name)
+                if service_file and service_file.startswith(self._path_prefixes):
+                    services.append(service_name)
+            else:
+                services.append(service_name)
+        
+        # Already sorted by systemctl, so this is a linear pass
+        services.sort()
+        self._svc_cache = (mtime_key, services)
+        return list(services)
+
+    def _list_unit_files(self):
+        """Return the names of all installed service unit files"""
+        try:
+            # systemd >= 246 can emit the unit file list as a single JSON array
+            result = subprocess.run(['systemctl', 'list-unit-files', '--type=service', '--output=json', '--no-pager'],
+                                  capture_output=True, check=True)
+            units = json.loads(result.stdout)
+            return [u['unit_file'] for u in units if u['unit_file'].endswith('.service')]
+        except (subprocess.CalledProcessError, ValueError, KeyError, TypeError):
+            pass
+        
+        # Older systemd: parse the column-aligned text output
+        unit_files = []
         try:
             result = subprocess.run(['systemctl', 'list-unit-files', '--type=service', '--no-pager'], 
-                                  capture_output=True, text=True, check=True)
+                                  capture_output=True, check=True)
             
-            for line in result.stdout.split('\n')[1:]:
-                if line.strip() and not line.startswith('UNIT FILE'):
+            for line in result.stdout.split(b'\n')[1:]:
+                if line.strip() and not line.startswith(b'UNIT FILE'):
                     parts = line.split()
-                    if len(parts) >= 2:
-                        service_name = parts[0]
-                        if service_name.endswith('.service'):
-                            if user_only:
-                                # Only include services in configured directories
-                                service_file = self.find_service_file(service_name)
-                                if service_file and any(service_file.startswith(str(p)) for p in self.service_paths):
-                                    services.append(service_name)
-                            else:
-                                services.append(service_name)
+                    if len(parts) >= 2 and parts[0].endswith(b'.service'):
+                        unit_files.append(parts[0].decode())
         except subprocess.CalledProcessError:
             pass
         
-        return sorted(services)
+        return unit_files
 
     def get_service_status(self, service):
         try:
-            result = subprocess.run(['systemctl', 'status', service, '--no-pager'], 
-                                  capture_output=True, text=True)
-            
             status_info = {
                 'name': service,
                 'active': False,
@@ -59,49 +177,99 @@ class SystemdControl:
                 'main_pid': None,
                 'memory': None,
                 'since': None,
+                'since_epoch': None,
                 'description': '',
                 'file_path': self.find_service_file(service)
             }
             
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if 'Active:' in line:
-                    status_info['active'] = 'active (running)' in line
-                    if 'since' in line:
-                        since_match = re.search(r'since (.+?)(?:;|$)', line)
-                        if since_match:
-                            status_info['since'] = since_match.group(1).strip()
-                elif 'Loaded:' in line:
-                    status_info['enabled'] = 'enabled' in line
-                elif 'Main PID:' in line:
-                    pid_match = re.search(r'Main PID: (\d+)', line)
-                    if pid_match:
-                        status_info['main_pid'] = pid_match.group(1)
-                elif 'Memory:' in line:
-                    memory_match = re.search(r'Memory: (.+?)(?:\s|$)', line)
-                    if memory_match:
-                        status_info['memory'] = memory_match.group(1)
-                elif line and not line.startswith('●') and not any(x in line for x in ['Active:', 'Loaded:', 'Main PID:', 'Memory:']):
-                    if not status_info['description']:
-                        status_info['description'] = line
+            # --lines=0 skips the journal; stop reading once every field is found
+            proc = subprocess.Popen(['systemctl', 'status', service, '--no-pager', '--lines=0'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            found = set()
+            try:
+                for line in proc.stdout:
+                    line = line.strip()
+                    key = line.partition(b':')[0]
+                    handler = _STATUS_HANDLERS.get(key)
+                    if handler:
+                        field = handler(line, status_info)
+                        if field:
+                            found.add(field)
+                    elif line and not line.startswith(_UNIT_BULLET) and not status_info['description']:
+                        found.add('description')
+                        status_info['description'] = line.decode(errors='replace')
+                    
+                    if len(found) == 5:
+                        proc.kill()
+                        break
+            finally:
+                proc.stdout.close()
+                proc.wait()
             
+            status_info['since_epoch'] = _since_epoch(status_info['since'])
             return status_info
         except Exception:
             return None
 
+    def get_all_statuses(self, services):
+        """Fetch status for many services with a single `systemctl show` call"""
+        # Template units (foo@.service) cannot be shown and would abort the batch
+        queried = [s for s in services if not s.endswith('@.service')]
+        properties = {}
+        
+        if queried:
+            try:
+                result = subprocess.run(['systemctl', 'show', '--no-pager',
+                                         '--property=' + ','.join(STATUS_PROPERTIES)] + queried,
+                                        capture_output=True)
+                # Match blocks to units by name (Names includes aliases), not position
+                wanted = set(queried)
+                for block in result.stdout.split(b'\n\n'):
+                    props = dict(line.split(b'=', 1) for line in block.split(b'\n') if b'=' in line)
+                    for name in props.get(b'Names', b'').decode(errors='replace').split():
+                        if name in wanted:
+                            properties[name] = props
+            except OSError:
+                pass
+        
+        # Query units the batch missed one by one, in parallel
+        missing = [s for s in queried if s not in properties]
+        fallback = {}
+        if missing:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(32, len(missing))) as executor:
+                fallback = dict(zip(missing, executor.map(self.get_service_status, missing)))
+        
+        from_properties = self._status_from_properties
+        get_fallback = fallback.get
+        get_properties = properties.get
+        return [get_fallback(service) or from_properties(service, get_properties(service, {}))
+                for service in services]
+
+    def _status_from_properties(self, service, props):
+        # props holds raw bytes from `systemctl show`; decode only what is displayed
+        memory = props.get(b'MemoryCurrent', b'')
+        main_pid = props.get(b'MainPID', b'0')
+        # Same 'since' as `systemctl status`: start time if running, stop time if not
+        since = props.get(b'StateChangeTimestamp')
+        since = since.decode() if since else None
+        return {
+            'name': service,
+            'active': props.get(b'ActiveState') == b'active' and props.get(b'SubState') == b'running',
+            'enabled': props.get(b'UnitFileState') == b'enabled',
+            'main_pid': main_pid.decode() if main_pid not in (b'', b'0') else None,
+            'memory': _format_bytes(memory) if memory.isdigit() and int(memory) < 2**64 - 1 else None,
+            'since': since,
+            'since_epoch': _since_epoch(since),
+            'description': props.get(b'Description', b'').decode(errors='replace'),
+            'file_path': self.find_service_file(service)
+        }
+
     def find_service_file(self, service):
-        for path in self.service_paths:
-            if self.config.get_recursive_search():
-                # Search recursively
-                matches = list(path.rglob(service))
-                if matches:
-                    return str(matches[0])
-            else:
-                # Direct path only
-                service_file = path / service
-                if service_file.exists():
-                    return str(service_file)
-        return None
+        # Walk the service directories once, then answer lookups from the index
+        if self._service_index is None:
+            self._service_index = self.config.get_service_index()
+        return self._service_index.get(service)
 
     def control_service(self, action, service):
         try:
@@ -112,35 +280,61 @@ class SystemdControl:
             return False, e.stderr
     
     def get_service_logs(self, service, lines=50):
+        # Stream journalctl's output instead of buffering it
         try:
-            result = subprocess.run(['journalctl', '-u', service, '-n', str(lines), '--no-pager'], 
-                                  capture_output=True, text=True, check=True)
-            return result.stdout.strip().split('\n') if result.stdout.strip() else []
-        except subprocess.CalledProcessError:
+            proc = subprocess.Popen(['journalctl', '-u', service, '-n', str(lines), '-o', 'short-iso', '--no-pager'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except OSError:
             return ["No logs available or service not found"]
+        
+        with proc:
+            logs = [line.rstrip('\n') for line in proc.stdout]
+        if proc.returncode != 0:
+            return ["No logs available or service not found"]
+        return logs
 
-    def format_uptime(self, since_str):
+    def format_uptime(self, since_str, since_epoch=None):
         if not since_str:
             return "N/A"
         
-        try:
-            since_time = datetime.strptime(since_str.split(';')[0].strip(), '%a %Y-%m-%d %H:%M:%S %Z')
-            uptime = datetime.now() - since_time
-            
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            
-            if days > 0:
-                return f"{days}d {hours}h {minutes}m"
-            elif hours > 0:
-                return f"{hours}h {minutes}m"
-            else:
-                return f"{minutes}m"
-        except:
-            return since_str
+        # Status dicts already carry the start time as epoch seconds
+        if since_epoch is None:
+            since_epoch = _since_epoch(since_str)
+            if since_epoch is None:
+                return since_str
+        
+        days, remainder = divmod(int(time.time()) - since_epoch, 86400)
+        hours, remainder = divmod(remainder, 3600)
+        minutes, _ = divmod(remainder, 60)
+        
+        if days > 0:
+            return f"{days}d {hours}h {minutes}m"
+        elif hours > 0:
+            return f"{hours}h {minutes}m"
+        else:
+            return f"{minutes}m"
+
+# Legacy top-level actions, e.g. `systemdcontrol list`, dispatched without argparse
+LEGACY_ACTIONS = ('list', 'start', 'stop', 'restart', 'status')
+
+def fast_dispatch(argv):
+    """Handle `<action> [service] [--all] [--system]`; return False if argv doesn't fit"""
+    action, rest = argv[0], argv[1:]
+    flags = {arg for arg in rest if arg.startswith('-')}
+    positional = [arg for arg in rest if not arg.startswith('-')]
+    if flags - {'--all', '--system'} or len(positional) > 1:
+        return False
+    
+    args = SimpleNamespace(service=positional[0] if positional else None,
+                           all='--all' in flags, system='--system' in flags)
+    handle_service_command(action, args, SystemdControl())
+    return True
 
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] in LEGACY_ACTIONS and fast_dispatch(sys.argv[1:]):
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(description='User-friendly systemd service control tool')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
@@ -175,9 +369,7 @@ def main():
     # Config reset
     config_subparsers.add_parser('reset', help='Reset configuration to defaults')
     
-    # Legacy support - if no subcommand, treat first arg as action
-    parser.add_argument('action', nargs='?', help=argparse.SUPPRESS)
-    parser.add_argument('service', nargs='?', help=argparse.SUPPRESS)
+    # Legacy support - accepted without an action, and start the TUI
     parser.add_argument('--all', action='store_true', help=argparse.SUPPRESS)
     parser.add_argument('--system', action='store_true', help=argparse.SUPPRESS)
     
@@ -190,14 +382,9 @@ def main():
         handle_config_command(args, controller)
         return
     
-    # Handle service commands or legacy mode
-    if args.command == 'service' or args.action:
-        action = args.action if hasattr(args, 'action') and args.action else None
-        if not action:
-            from systemdcontrol_tui import run_tui
-            run_tui(controller)
-            return
-        handle_service_command(action, args, controller)
+    # Handle service commands (legacy top-level actions go through fast_dispatch)
+    if args.command == 'service':
+        handle_service_command(args.action, args, controller)
         return
     
     # Default to TUI mode
@@ -261,18 +448,17 @@ def handle_service_command(action, args, controller):
         print(f"{'SERVICE':<30} {'STATUS':<10} {'ENABLED':<8} {'UPTIME':<15} {'FILE PATH'}")
         print("-" * 90)
         
-        for service in services:
-            status = controller.get_service_status(service)
-            if status:
-                if not args.all and not status['active']:
-                    continue
-                    
-                status_str = 'active' if status['active'] else 'inactive'
-                enabled_str = 'enabled' if status['enabled'] else 'disabled'
-                uptime = controller.format_uptime(status['since'])
-                file_path = status['file_path'] or 'system'
-                
-                print(f"{service:<30} {status_str:<10} {enabled_str:<8} {uptime:<15} {file_path}")
+        for status in controller.get_all_statuses(services):
+            service = status['name']
+            if not args.all and not status['active']:
+                continue
+            
+            status_str = 'active' if status['active'] else 'inactive'
+            enabled_str = 'enabled' if status['enabled'] else 'disabled'
+            uptime = controller.format_uptime(status['since'], status['since_epoch'])
+            file_path = status['file_path'] or 'system'
+            
+            print(f"{service:<30} {status_str:<10} {enabled_str:<8} {uptime:<15} {file_path}")
     
     elif action in ['start', 'stop', 'restart']:
         if not args.service:
@@ -298,7 +484,7 @@ def handle_service_command(action, args, controller):
             print(f"Status: {'active' if status['active'] else 'inactive'}")
             print(f"Enabled: {'yes' if status['enabled'] else 'no'}")
             print(f"Since: {status['since'] or 'N/A'}")
-            print(f"Uptime: {controller.format_uptime(status['since'])}")
+            print(f"Uptime: {controller.format_uptime(status['since'], status['since_epoch'])}")
             print(f"Main PID: {status['main_pid'] or 'N/A'}")
             print(f"Memory: {status['memory'] or 'N/A'}")
             print(f"Service file: {status['file_path'] or 'system location'}")
@@ -1,9 +1,30 @@
 #!/usr/bin/env python3
 
 import curses
-import subprocess
+import itertools
+import os
+import queue
+import threading
 import time
-from datetime import datetime
+
+# Synchronized output (DEC mode 2026); other terminals ignore it
+SYNC_BEGIN = b'\x1b[?2026h'
+SYNC_END = b'\x1b[?2026l'
+
+# ASCII art logo for the loading screen
+LOGO = (
+    "  ____            _                 ____    ____            _             _ ",
+    " / ___| _   _ ___| |_ ___ _ __ ___  |  _ \\  / ___|___  _ __ | |_ _ __ ___ | |",
+    " \\___ \\| | | / __| __/ _ \\ '_ ` _ \\ | | | || |   / _ \\| '_ \\| __| '__/ _ \\| |",
+    "  ___) | |_| \\__ \\ ||  __/ | | | | || |_| || |__| (_) | | | | |_| | | (_) | |",
+    " |____/ \\__, |___/\\__\\___|_| |_| |_||____/  \\____\\___/|_| |_|\\__|_|  \\___/|_|",
+    "        |___/                                                              "
+)
+LOGO_WIDTH = max(len(line) for line in LOGO)
+
+# Widths of the colored name and status columns in a service row
+NAME_WIDTH = 30
+STATUS_WIDTH = 10
 
 def run_tui(controller):
     try:
@@ -20,9 +41,58 @@ class TUI:
         self.last_refresh = 0
         self.initial_load = True
         
+        # What each service row last drew, so unchanged rows can be skipped
+        self._row_cache = []
+        self._prev_selection = -1
+        # Index of the first service shown; the list scrolls to follow the selection
+        self._top = 0
+        self._full_redraw = True
+        self._drawn_size = None
+        self._last_status = ''
+        self._header_drawn = False
+        # Last initial log page fetched: (service, time.monotonic(), lines)
+        self._log_cache = None
+        # (message, time.monotonic() deadline) shown on the status line, or None
+        self._brief = None
+        # Set when the main screen needs drawing; run() skips idle frames otherwise
+        self._dirty = True
+        self._drawn_minute = None
+        # Terminal size, re-read only when curses reports a resize
+        self._size = self.stdscr.getmaxyx()
+        
+        # Background refresh: the worker fills _pending_services, run() swaps it in
+        self._refresh_thread = None
+        self._pending_services = None
+        # Guards the controller's caches between worker and synchronous refreshes
+        self._refresh_lock = threading.Lock()
+        # Bumped by synchronous refreshes and config reloads to drop older results
+        self._refresh_generation = 0
+        # Set after a service action; run() starts a refresh as soon as none is running
+        self._refresh_requested = False
+        # Last refresh error shown, so a persistent one isn't repeated
+        self._refresh_error = None
+        
+        self.load_settings()
+        # The Linux console and real VT terminals predate synchronized output
+        term = os.environ.get('TERM', '')
+        self._sync_output = bool(term) and not term.startswith(('linux', 'vt', 'dumb'))
+        
         curses.curs_set(0)
+        # The cursor is hidden, so don't move it after each update
+        self.stdscr.leaveok(True)
+        # Use terminal insert/delete operations and buffer writes until doupdate()
+        self.stdscr.idlok(True)
+        self.stdscr.idcok(True)
+        self.stdscr.immedok(False)
+        # getch() times out so refreshes happen without input; run() sets the delay
+        self.stdscr.timeout(250)
         self.init_colors()
         
+    def load_settings(self):
+        """Cache the settings read on every frame; only the config screen changes them"""
+        self._refresh_interval = self.controller.config.get_refresh_interval()
+        self._user_only = self.controller.config.get_user_services_only()
+    
     def init_colors(self):
         if curses.has_colors():
             curses.start_color()
@@ -31,39 +101,36 @@ class TUI:
             curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK) # warning
             curses.init_pair(4, curses.COLOR_CYAN, curses.COLOR_BLACK)   # header
             curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_BLUE)   # selected
+        
+        # Attributes used on every frame, looked up once
+        self.ATTR_ACTIVE = curses.color_pair(1)
+        self.ATTR_INACTIVE = curses.color_pair(2)
+        self.ATTR_SELECTED = curses.color_pair(5) | curses.A_BOLD
+        self.ATTR_HEADER = curses.color_pair(4) | curses.A_BOLD
     
     def show_loading_screen(self):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
-        self.stdscr.clear()
-        
-        # ASCII art logo
-        logo = [
-            "  ____            _                 ____    ____            _             _ ",
-            " / ___| _   _ ___| |_ ___ _ __ ___  |  _ \\  / ___|___  _ __ | |_ _ __ ___ | |",
-            " \\___ \\| | | / __| __/ _ \\ '_ ` _ \\ | | | || |   / _ \\| '_ \\| __| '__/ _ \\| |",
-            "  ___) | |_| \\__ \\ ||  __/ | | | | || |_| || |__| (_) | | | | |_| | | (_) | |",
-            " |____/ \\__, |___/\\__\\___|_| |_| |_||____/  \\____\\___/|_| |_|\\__|_|  \\___/|_|",
-            "        |___/                                                              "
-        ]
+        self.stdscr.erase()
         
         try:
             # Draw logo if terminal is big enough
             if height > 15 and width > 75:
                 start_row = (height // 2) - 5
-                for i, line in enumerate(logo):
+                logo_x = max(0, (width - LOGO_WIDTH) // 2)
+                logo_attr = curses.color_pair(4) | curses.A_BOLD
+                for i, line in enumerate(LOGO):
                     if start_row + i < height - 1 and len(line) < width:
-                        self.stdscr.addstr(start_row + i, (width - len(line)) // 2, line, 
-                                         curses.color_pair(4) | curses.A_BOLD)
+                        self.stdscr.addstr(start_row + i, logo_x, line, logo_attr)
                 
                 # Loading message
                 loading_msg = "Loading services..."
-                self.stdscr.addstr(start_row + len(logo) + 2, (width - len(loading_msg)) // 2, 
+                self.stdscr.addstr(start_row + len(LOGO) + 2, (width - len(loading_msg)) // 2, 
                                  loading_msg, curses.color_pair(3) | curses.A_BOLD)
                 
                 # Progress indicator
                 progress_msg = "Please wait..."
-                self.stdscr.addstr(start_row + len(logo) + 3, (width - len(progress_msg)) // 2, 
+                self.stdscr.addstr(start_row + len(LOGO) + 3, (width - len(progress_msg)) // 2, 
                                  progress_msg, curses.A_DIM)
             
             elif height > 6 and width > 30:
@@ -85,69 +152,177 @@ class TUI:
                 else:
                     self.stdscr.addstr(0, 0, "Loading", curses.color_pair(3))
             
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            curses.doupdate()
             
         except curses.error:
             # If drawing fails, just show simple text
             try:
                 self.stdscr.addstr(0, 0, "Loading services...", curses.color_pair(3))
-                self.stdscr.refresh()
+                self.stdscr.noutrefresh()
+                curses.doupdate()
             except curses.error:
                 pass
     
     def refresh_services(self):
-        user_only = self.controller.config.get_user_services_only()
-        all_services = self.controller.get_services(user_only=user_only)
-        self.services = []
+        user_only = self._user_only
+        with self._refresh_lock:
+            all_services = self.controller.get_services(user_only=user_only)
+            statuses = self.controller.get_all_statuses(all_services)
+            self.services = self.prepare_rows(statuses)
+            self._refresh_generation += 1
+            self._dirty = True
+        
+        self.last_refresh = time.time()
+    
+    def load_services_with_progress(self):
+        """Initial load on a worker thread, with progress; returns False if the user quit"""
+        user_only = self._user_only
+        results = queue.Queue()
+        
+        def worker():
+            try:
+                with self._refresh_lock:
+                    all_services = self.controller.get_services(user_only=user_only)
+                    results.put(len(all_services))
+                    # Query in batches of 25 so the progress line has something to count
+                    for start in range(0, len(all_services), 25):
+                        results.put(self.controller.get_all_statuses(all_services[start:start + 25]))
+            except Exception as e:
+                # Reported by the main thread instead of printed over the screen
+                results.put(e)
+            finally:
+                results.put(None)
+        
+        threading.Thread(target=worker, daemon=True).start()
         
-        # Show progress during initial load
-        if self.initial_load and all_services:
-            height, width = self.stdscr.getmaxyx()
-            total_services = len(all_services)
+        # Pick up batches as they arrive; 'q' still works if systemctl hangs
+        self.stdscr.timeout(50)
+        statuses = []
+        total = 0
+        error = None
+        while True:
+            try:
+                item = results.get_nowait()
+            except queue.Empty:
+                key = self.stdscr.getch()
+                if key == ord('q') or key == 27:  # q or ESC
+                    return False
+                if key == curses.KEY_RESIZE:
+                    self.handle_resize()
+                    self.show_loading_screen()
+                    if total:
+                        self.update_progress(len(statuses), total)
+                continue
             
-            for i, service in enumerate(all_services):
-                status = self.controller.get_service_status(service)
-                if status:
-                    self.services.append(status)
-                
-                # Update progress every few services to avoid too much screen updating
-                if i % 3 == 0 or i == total_services - 1:
-                    try:
-                        progress_percent = int((i + 1) / total_services * 100)
-                        progress_msg = f"Loading services... {progress_percent}% ({i + 1}/{total_services})"
-                        
-                        # Find the loading message position and update it
-                        if height > 15 and width > 75:
-                            # Large terminal with logo
-                            start_row = (height // 2) - 5 + 8  # After logo + 2 lines
-                            if width > len(progress_msg):
-                                # Clear the line first
-                                self.stdscr.addstr(start_row, 0, " " * min(width - 1, 100))
-                                self.stdscr.addstr(start_row, (width - len(progress_msg)) // 2, 
-                                                 progress_msg, curses.color_pair(3) | curses.A_BOLD)
-                        elif height > 6 and width > 30:
-                            # Medium terminal
-                            progress_row = height // 2 + 1
-                            if width > len(progress_msg):
-                                self.stdscr.addstr(progress_row, 0, " " * min(width - 1, 100))
-                                self.stdscr.addstr(progress_row, (width - len(progress_msg)) // 2, 
-                                                 progress_msg, curses.color_pair(3))
-                        
-                        self.stdscr.refresh()
-                        
-                    except curses.error:
-                        pass
-        else:
-            # Normal refresh without progress display
-            for service in all_services:
-                status = self.controller.get_service_status(service)
-                if status:
-                    self.services.append(status)
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                error = item
+            elif isinstance(item, int):
+                total = item
+            else:
+                statuses.extend(item)
+            if total:
+                self.update_progress(len(statuses), total)
+        
+        if error is not None:
+            self.show_message(f"Error loading services: {error}", is_error=True)
+        
+        self.services = self.prepare_rows(statuses)
+        self._refresh_generation += 1
+        self._dirty = True
+        self.last_refresh = time.time()
+        return True
+    
+    def start_background_refresh(self):
+        """Fetch service statuses on a worker thread so input isn't blocked"""
+        if self._refresh_thread is not None:
+            return
+        
+        self._refresh_requested = False
+        user_only = self._user_only
+        generation = self._refresh_generation
+        
+        def worker():
+            try:
+                with self._refresh_lock:
+                    all_services = self.controller.get_services(user_only=user_only)
+                    statuses = self.controller.get_all_statuses(all_services)
+                statuses = self.prepare_rows(statuses)
+            except Exception as e:
+                # Reported by run(); a traceback would land on the curses screen
+                statuses = e
+            # A single assignment, so run() never sees a half-built result
+            self._pending_services = (generation, statuses)
         
+        self._refresh_thread = threading.Thread(target=worker, daemon=True)
+        self._refresh_thread.start()
+    
+    def finish_background_refresh(self):
+        """Swap in the worker's results once it has finished"""
+        if self._refresh_thread is None or self._refresh_thread.is_alive():
+            return
+        
+        self._refresh_thread = None
         self.last_refresh = time.time()
+        if self._pending_services is not None:
+            generation, services = self._pending_services
+            self._pending_services = None
+            if isinstance(services, Exception):
+                # Keep the previous list; report each distinct error only once
+                if str(services) != self._refresh_error:
+                    self._refresh_error = str(services)
+                    self.show_message(f"Error refreshing services: {services}", is_error=True)
+                    self.resume_main_screen()
+            elif generation == self._refresh_generation:
+                self.services = services
+                self._refresh_error = None
+                self._dirty = True
+    
+    def prepare_rows(self, services):
+        """Format the columns that only change when a service's status does"""
+        # draw_header requires 80 columns, so the name column always fits
+        for service in services:
+            status_text = 'active' if service['active'] else 'inactive'
+            enabled_text = 'yes' if service['enabled'] else 'no'
+            memory = service['memory'][:8] if service['memory'] else 'N/A'
+            service['_cells'] = (f"{service['name'][:NAME_WIDTH - 2]:<{NAME_WIDTH}}{status_text:<{STATUS_WIDTH}}{enabled_text:<10}",
+                                 memory)
+        return services
+    
+    def update_progress(self, done, total):
+        height, width = self._size
+        
+        try:
+            progress_percent = int(done / total * 100)
+            progress_msg = f"Loading services... {progress_percent}% ({done}/{total})"
+            
+            # Find the loading message position and update it
+            if height > 15 and width > 75:
+                # Large terminal with logo
+                start_row = (height // 2) - 5 + 8  # After logo + 2 lines
+                if width > len(progress_msg):
+                    # Clear the line first
+                    self.stdscr.addstr(start_row, 0, " " * min(width - 1, 100))
+                    self.stdscr.addstr(start_row, (width - len(progress_msg)) // 2, 
+                                     progress_msg, curses.color_pair(3) | curses.A_BOLD)
+            elif height > 6 and width > 30:
+                # Medium terminal
+                progress_row = height // 2 + 1
+                if width > len(progress_msg):
+                    self.stdscr.addstr(progress_row, 0, " " * min(width - 1, 100))
+                    self.stdscr.addstr(progress_row, (width - len(progress_msg)) // 2, 
+                                     progress_msg, curses.color_pair(3))
+            
+            self.stdscr.noutrefresh()
+            curses.doupdate()
+            
+        except curses.error:
+            pass
     
     def draw_header(self):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         # Check minimum terminal size
         min_width = 80
@@ -155,7 +330,7 @@ class TUI:
         
         if width < min_width or height < min_height:
             try:
-                self.stdscr.clear()
+                self.stdscr.erase()
                 error_msg = f"Terminal too small! Need at least {min_width}x{min_height}, got {width}x{height}"
                 if width > len(error_msg):
                     self.stdscr.addstr(height // 2, (width - len(error_msg)) // 2, error_msg, 
@@ -165,16 +340,18 @@ class TUI:
                     self.stdscr.addstr(0, 0, "Terminal too small!", curses.color_pair(2))
                     if height > 1:
                         self.stdscr.addstr(1, 0, "Resize window", curses.color_pair(2))
-                self.stdscr.refresh()
             except curses.error:
                 pass
             return False
         
+        # The header is static, so it stays on screen until the next full redraw
+        if self._header_drawn:
+            return True
+        
         try:
             title = "SystemD Control - User Services"
             if width > len(title):
-                self.stdscr.addstr(0, (width - len(title)) // 2, title, 
-                                  curses.color_pair(4) | curses.A_BOLD)
+                self.stdscr.addstr(0, (width - len(title)) // 2, title, self.ATTR_HEADER)
             
             help_text = "q:quit r:refresh s:start p:stop e:restart space:status l:logs c:config"
             if len(help_text) < width:
@@ -203,7 +380,7 @@ class TUI:
         except curses.error:
             # If any drawing fails, show error message
             try:
-                self.stdscr.clear()
+                self.stdscr.erase()
                 error_msg = "Display error - resize terminal"
                 if width > len(error_msg):
                     self.stdscr.addstr(0, 0, error_msg, curses.color_pair(2))
@@ -211,10 +388,11 @@ class TUI:
                 pass
             return False
         
+        self._header_drawn = True
         return True
     
-    def draw_services(self):
-        height, width = self.stdscr.getmaxyx()
+    def draw_services(self, rows=None):
+        height, width = self._size
         start_row = 6
         max_services = height - start_row - 2
         
@@ -225,45 +403,79 @@ class TUI:
         if self.current_selection >= len(self.services):
             self.current_selection = max(0, len(self.services) - 1)
         
-        try:
-            for i, service in enumerate(self.services[:max_services]):
-                row = start_row + i
-                if row >= height - 1:  # Don't draw past screen
-                    break
-                
-                name = service['name'][:min(28, width - 50)]
-                status_text = 'active' if service['active'] else 'inactive'
-                enabled_text = 'yes' if service['enabled'] else 'no'
-                uptime = self.controller.format_uptime(service['since'])[:14]
-                memory = service['memory'][:8] if service['memory'] else 'N/A'
-                
-                color = curses.color_pair(1) if service['active'] else curses.color_pair(2)
-                attr = curses.A_REVERSE if i == self.current_selection else 0
-                
-                if i == self.current_selection:
-                    selected_line = f" {name:<28} {status_text:<8} {enabled_text:<6} {uptime:<14} {memory:<8} "
-                    if len(selected_line) < width:
-                        self.stdscr.addstr(row, 1, selected_line, 
-                                         curses.color_pair(5) | curses.A_BOLD)
-                else:
-                    # Draw each column with bounds checking
-                    if width > 30:
-                        self.stdscr.addstr(row, 2, name, color | attr)
-                    if width > 40:
-                        self.stdscr.addstr(row, 32, status_text, color | attr)
-                    if width > 50:
-                        self.stdscr.addstr(row, 42, enabled_text, attr)
-                    if width > 60:
-                        self.stdscr.addstr(row, 52, uptime, attr)
-                    if width > 75:
-                        self.stdscr.addstr(row, 68, memory, attr)
+        # Scroll the list just far enough to keep the selection on screen
+        cur_sel = self.current_selection
+        top = self._top
+        if cur_sel < top:
+            top = cur_sel
+        elif cur_sel >= top + max_services:
+            top = cur_sel - max_services + 1
+        top = max(0, min(top, len(self.services) - max_services))
+        
+        visible = min(len(self.services) - top, max_services)
         
+        try:
+            if rows is not None and top == self._top:
+                for index in rows:
+                    i = index - top
+                    if 0 <= i < visible:
+                        self.redraw_row(i, self.services[index], width, index == cur_sel)
+                self._prev_selection = cur_sel
+                return
+            self._top = top
+            
+            redraw_row = self.redraw_row
+            for i, service in enumerate(itertools.islice(self.services, top, top + max_services)):
+                redraw_row(i, service, width, top + i == cur_sel)
+            
+            # Blank out rows left over from a previously longer list
+            for i in range(visible, len(self._row_cache)):
+                if start_row + i < height - 1:
+                    self.stdscr.move(start_row + i, 0)
+                    self.stdscr.clrtoeol()
+            del self._row_cache[visible:]
+            self._prev_selection = self.current_selection
         except curses.error:
-            # Silently handle drawing errors for very small terminals
-            pass
+            # Another getch() may have resized stdscr; redraw at the new size
+            self._size = self.stdscr.getmaxyx()
+            self._full_redraw = True
+    
+    def redraw_row(self, i, service, width, selected):
+        """Draw service row i, skipping it if it is unchanged since the last draw"""
+        row = 6 + i
+        prefix, memory = service['_cells']
+        # Uptime changes with the clock, so it is formatted here
+        uptime = self.controller.format_uptime(service['since'], service['since_epoch'])[:14]
+        
+        text = (prefix, memory, uptime)
+        cached = self._row_cache[i] if i < len(self._row_cache) else None
+        if cached == (text, selected):
+            return
+        if cached is None:
+            self._row_cache.append((text, selected))
+        else:
+            self._row_cache[i] = (text, selected)
+        
+        # Rows share one layout, so a selection change only needs new attributes
+        line = f"{prefix}{uptime:<16}{memory:<8}"
+        if len(line) + 3 >= width:
+            return
+        
+        if cached is None or cached[0] != text:
+            self.stdscr.move(row, 0)
+            self.stdscr.clrtoeol()
+            self.stdscr.addstr(row, 2, line)
+        
+        if selected:
+            self.stdscr.chgat(row, 1, len(line) + 2, self.ATTR_SELECTED)
+        else:
+            self.stdscr.chgat(row, 1, len(line) + 2, curses.A_NORMAL)
+            # Color just the name and status columns
+            self.stdscr.chgat(row, 2, NAME_WIDTH + STATUS_WIDTH,
+                              self.ATTR_ACTIVE if service['active'] else self.ATTR_INACTIVE)
     
     def show_status_detail(self, service_status):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         popup_height = 12
         popup_width = min(80, width - 4)
@@ -274,22 +486,24 @@ class TUI:
         popup.box()
         
         popup.addstr(1, 2, f"Service: {service_status['name']}", curses.A_BOLD)
-        popup.addstr(2, 2, f"Description: {service_status['description'][:popup_width-15]}")
+        popup.addnstr(2, 2, f"Description: {service_status['description']}", popup_width - 2)
         popup.addstr(3, 2, f"Status: {'active' if service_status['active'] else 'inactive'}")
         popup.addstr(4, 2, f"Enabled: {'yes' if service_status['enabled'] else 'no'}")
         popup.addstr(5, 2, f"Since: {service_status['since'] or 'N/A'}")
-        popup.addstr(6, 2, f"Uptime: {self.controller.format_uptime(service_status['since'])}")
+        popup.addstr(6, 2, f"Uptime: {self.controller.format_uptime(service_status['since'], service_status['since_epoch'])}")
         popup.addstr(7, 2, f"Main PID: {service_status['main_pid'] or 'N/A'}")
         popup.addstr(8, 2, f"Memory: {service_status['memory'] or 'N/A'}")
         popup.addstr(9, 2, f"Service file: {service_status['file_path'] or 'system location'}")
         
         popup.addstr(popup_height - 2, 2, "Press any key to continue...", curses.A_DIM)
         
-        popup.refresh()
-        popup.getch()
+        popup.noutrefresh()
+        curses.doupdate()
+        if popup.getch() == curses.KEY_RESIZE:
+            self.handle_resize()
     
     def show_message(self, message, is_error=False):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         msg_height = 5
         msg_width = min(len(message) + 6, width - 4)
@@ -300,29 +514,29 @@ class TUI:
         msg_win.box()
         
         color = curses.color_pair(2) if is_error else curses.color_pair(1)
-        msg_win.addstr(2, 3, message[:msg_width-6], color | curses.A_BOLD)
+        msg_win.addnstr(2, 3, message, msg_width-6, color | curses.A_BOLD)
         msg_win.addstr(3, 3, "Press any key to continue...")
         
-        msg_win.refresh()
-        msg_win.getch()
+        msg_win.noutrefresh()
+        curses.doupdate()
+        if msg_win.getch() == curses.KEY_RESIZE:
+            self.handle_resize()
     
     def show_brief_message(self, message):
-        height, width = self.stdscr.getmaxyx()
-        
-        # Show message in status line briefly
-        self.stdscr.addstr(height - 1, 2, message[:width-4], curses.color_pair(1) | curses.A_BOLD)
-        self.stdscr.refresh()
-        time.sleep(0.3)
+        height, width = self._size
         
-        # Clear the message
-        self.stdscr.addstr(height - 1, 2, " " * (width - 4))
-        self.stdscr.refresh()
+        # Show message in status line briefly; draw_frame keeps it until the deadline
+        self._brief = (message, time.monotonic() + 0.3)
+        self._dirty = True
+        self.stdscr.move(height - 1, 0)
+        self.stdscr.clrtoeol()
+        self.stdscr.addnstr(height - 1, 2, message, width-4, curses.color_pair(1) | curses.A_BOLD)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
     
     def show_service_logs(self, service_status):
         service_name = service_status['name']
-        logs = self.controller.get_service_logs(service_name, lines=100)
-        
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         # Check if terminal is too small for log viewer
         if width < 40 or height < 8:
@@ -331,45 +545,100 @@ class TUI:
         
         # Create a full-screen log viewer
         log_win = curses.newwin(height - 2, width - 2, 1, 1)
+        log_win.keypad(True)
+        log_win.leaveok(True)
         log_win.box()
         
         # Header
         title = f"Logs for {service_name} (↑/↓ scroll, q to close)"
-        log_win.addstr(1, 2, title[:width-6], curses.A_BOLD)
+        log_win.addnstr(1, 2, title, width-6, curses.A_BOLD)
         log_win.hline(2, 1, '-', width - 4)
         
         # Calculate display area
         display_height = height - 6  # Leave room for box, header, and controls
+        
+        # Fetch a screenful plus a margin; older lines load past the top
+        page_size = display_height + 50
+        requested = page_size
+        cached = self._log_cache
+        if cached and cached[0] == service_name and time.monotonic() - cached[1] < 2:
+            logs = cached[2]
+            requested = max(requested, len(logs))
+        else:
+            loading_msg = "Loading logs..."
+            log_win.addstr(3, 2, loading_msg)
+            log_win.noutrefresh()
+            curses.doupdate()
+            logs = self.controller.get_service_logs(service_name, lines=requested)
+            self._log_cache = (service_name, time.monotonic(), logs)
+            log_win.addstr(3, 2, ' ' * len(loading_msg))
+        
         scroll_pos = max(0, len(logs) - display_height)  # Start at bottom
+        line_width = width - 6
+        # Logs are written once into a pad that scrolls inside the box
+        log_pad = self.build_log_pad(logs, line_width, display_height)
+        info_width = len(f"Line {len(logs)}-{len(logs)} of {len(logs)}")
+        drawn_pos = None
+        input_pending = False
         
         while True:
-            log_win.clear()
-            log_win.box()
-            log_win.addstr(1, 2, title[:width-6], curses.A_BOLD)
-            log_win.hline(2, 1, '-', width - 4)
-            
-            # Show logs
-            for i in range(display_height):
-                line_idx = scroll_pos + i
-                if line_idx < len(logs):
-                    log_line = logs[line_idx][:width-6]  # Truncate long lines
+            if input_pending:
+                log_win.timeout(0)
+            elif scroll_pos != drawn_pos:
+                # Show scroll indicator
+                if len(logs) > display_height:
+                    scroll_info = f"Line {scroll_pos + 1}-{min(scroll_pos + display_height, len(logs))} of {len(logs)}"
                     try:
-                        log_win.addstr(3 + i, 2, log_line)
+                        log_win.addstr(height - 3, width - info_width - 4, scroll_info.rjust(info_width), curses.A_DIM)
                     except curses.error:
-                        pass  # Ignore if we can't draw at this position
-            
-            # Show scroll indicator
-            if len(logs) > display_height:
-                scroll_info = f"Line {scroll_pos + 1}-{min(scroll_pos + display_height, len(logs))} of {len(logs)}"
-                log_win.addstr(height - 3, width - len(scroll_info) - 4, scroll_info, curses.A_DIM)
-            
-            log_win.refresh()
+                        pass
+                
+                drawn_pos = scroll_pos
+                log_win.noutrefresh()
+                log_pad.noutrefresh(scroll_pos, 0, 4, 3, height - 3, width - 4)
+                curses.doupdate()
             
             # Handle input
             key = log_win.getch()
+            if key == -1:
+                input_pending = False
+                log_win.timeout(-1)
+                continue
+            input_pending = True
+            
+            if (scroll_pos == 0 and len(logs) >= requested and
+                    key in (curses.KEY_UP, ord('k'), curses.KEY_PPAGE, curses.KEY_HOME)):
+                requested += page_size
+                older = self.controller.get_service_logs(service_name, lines=requested)
+                added = len(older) - len(logs)
+                if added > 0:
+                    # Keep the same lines in view; the key below then scrolls into the new ones
+                    logs = older
+                    log_pad = self.build_log_pad(logs, line_width, display_height)
+                    scroll_pos = added
+                    info_width = len(f"Line {len(logs)}-{len(logs)} of {len(logs)}")
+                    drawn_pos = None
             
             if key == ord('q') or key == 27:  # q or ESC
                 break
+            elif key == curses.KEY_RESIZE:
+                height, width = self.handle_resize()
+                if width < 40 or height < 8:
+                    break
+                # Lay out again at the new size, staying at the bottom if there
+                at_bottom = scroll_pos >= len(logs) - display_height
+                self.stdscr.noutrefresh()
+                log_win.resize(height - 2, width - 2)
+                log_win.erase()
+                log_win.box()
+                log_win.addnstr(1, 2, title, width-6, curses.A_BOLD)
+                log_win.hline(2, 1, '-', width - 4)
+                display_height = height - 6
+                line_width = width - 6
+                log_pad = self.build_log_pad(logs, line_width, display_height)
+                bottom = max(0, len(logs) - display_height)
+                scroll_pos = bottom if at_bottom else min(scroll_pos, bottom)
+                drawn_pos = None
             elif key == curses.KEY_UP or key == ord('k'):
                 scroll_pos = max(0, scroll_pos - 1)
             elif key == curses.KEY_DOWN or key == ord('j'):
@@ -383,8 +652,20 @@ class TUI:
             elif key == curses.KEY_END:
                 scroll_pos = max(0, len(logs) - display_height)
     
+    def build_log_pad(self, logs, line_width, display_height):
+        """Write log lines into a pad tall enough to scroll through all of them"""
+        # One spare column so writing a full-width line doesn't wrap past the end
+        pad = curses.newpad(max(len(logs), display_height), line_width + 1)
+        pad.leaveok(True)
+        for i, log_line in enumerate(logs):
+            try:
+                pad.addnstr(i, 0, log_line, line_width)
+            except curses.error:
+                pass  # Ignore lines that can't be drawn
+        return pad
+    
     def show_config_screen(self):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         # Check if terminal is too small for config screen
         if width < 60 or height < 15:
@@ -394,26 +675,30 @@ class TUI:
         config = self.controller.config
         
         config_win = curses.newwin(height - 2, width - 2, 1, 1)
+        config_win.leaveok(True)
         config_win.box()
         
         title = "Configuration Settings (↑/↓ navigate, Enter to edit, q to close)"
-        config_win.addstr(1, 2, title[:width-6], curses.A_BOLD)
+        config_win.addnstr(1, 2, title, width-6, curses.A_BOLD)
         config_win.hline(2, 1, '-', width - 4)
         
-        config_options = [
-            ("Service Directories", config.get_service_directories()),
-            ("Recursive Search", config.get_recursive_search()),
-            ("User Services Only", config.get_user_services_only()),
-            ("Refresh Interval", f"{config.get_refresh_interval()}s"),
-            ("Config File", str(config.config_file))
-        ]
+        config_options = self.build_config_options(config, width)
         
         selection = 0
         
         while True:
-            config_win.clear()
+            if self._size != (height, width):
+                # Resized, here or in one of the editors opened from here
+                height, width = self._size
+                if width < 60 or height < 15:
+                    break
+                self.stdscr.noutrefresh()
+                config_win.resize(height - 2, width - 2)
+                config_options = self.build_config_options(config, width)
+            
+            config_win.erase()
             config_win.box()
-            config_win.addstr(1, 2, title[:width-6], curses.A_BOLD)
+            config_win.addnstr(1, 2, title, width-6, curses.A_BOLD)
             config_win.hline(2, 1, '-', width - 4)
             
             for i, (key, value) in enumerate(config_options):
@@ -423,22 +708,18 @@ class TUI:
                 
                 attr = curses.A_REVERSE if i == selection else 0
                 config_win.addstr(row, 3, f"{key}:", curses.A_BOLD | attr)
-                
-                value_str = str(value)
-                if isinstance(value, list):
-                    value_str = ', '.join(value)
-                elif len(value_str) > width - 25:
-                    value_str = value_str[:width-28] + "..."
-                
-                config_win.addstr(row + 1, 5, value_str, attr)
+                config_win.addstr(row + 1, 5, value, attr)
             
             config_win.addstr(height - 4, 3, "Press 'r' to reset to defaults", curses.A_DIM)
-            config_win.refresh()
+            config_win.noutrefresh()
+            curses.doupdate()
             
             key = config_win.getch()
             
             if key == ord('q') or key == 27:
                 break
+            elif key == curses.KEY_RESIZE:
+                self.handle_resize()
             elif key == curses.KEY_UP or key == ord('k'):
                 selection = max(0, selection - 1)
             elif key == curses.KEY_DOWN or key == ord('j'):
@@ -446,23 +727,34 @@ class TUI:
             elif key == ord('\n') or key == ord('\r'):
                 if selection < len(config_options) - 1:  # Don't edit config file path
                     self.edit_config_option(selection, config)
-                    # Refresh config options after edit
-                    config_options = [
-                        ("Service Directories", config.get_service_directories()),
-                        ("Recursive Search", config.get_recursive_search()),
-                        ("User Services Only", config.get_user_services_only()),
-                        ("Refresh Interval", f"{config.get_refresh_interval()}s"),
-                        ("Config File", str(config.config_file))
-                    ]
+                    config_options[selection] = self.config_option_row(selection, config, width)
             elif key == ord('r'):
                 self.reset_config(config)
-                config_options = [
-                    ("Service Directories", config.get_service_directories()),
-                    ("Recursive Search", config.get_recursive_search()),
-                    ("User Services Only", config.get_user_services_only()),
-                    ("Refresh Interval", f"{config.get_refresh_interval()}s"),
-                    ("Config File", str(config.config_file))
-                ]
+                config_options = self.build_config_options(config, width)
+    
+    def build_config_options(self, config, width):
+        """List (label, display value) pairs for the config screen"""
+        return [self.config_option_row(i, config, width) for i in range(5)]
+    
+    def config_option_row(self, index, config, width):
+        """Build the (label, display value) pair for one config screen row"""
+        if index == 0:
+            key, value = "Service Directories", config.get_service_directories()
+        elif index == 1:
+            key, value = "Recursive Search", config.get_recursive_search()
+        elif index == 2:
+            key, value = "User Services Only", config.get_user_services_only()
+        elif index == 3:
+            key, value = "Refresh Interval", f"{config.get_refresh_interval()}s"
+        else:
+            key, value = "Config File", str(config.config_file)
+        
+        value_str = str(value)
+        if isinstance(value, list):
+            value_str = ', '.join(value)
+        elif len(value_str) > width - 25:
+            value_str = value_str[:width-28] + "..."
+        return (key, value_str)
     
     def edit_config_option(self, selection, config):
         config_changed = False
@@ -489,37 +781,59 @@ class TUI:
         
         # Reload controller config if service-related settings changed
         if config_changed and selection in [0, 1, 2]:  # Service dirs, recursive, or user-only
+            self.reload_controller_config()
+    
+    def reload_controller_config(self):
+        """Apply config changes to the controller without racing a background refresh"""
+        # Drop any in-flight result fetched with the old settings
+        with self._refresh_lock:
             self.controller.reload_config()
+            self._refresh_generation += 1
     
     def edit_service_directories(self, config):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         dir_win = curses.newwin(height - 4, width - 4, 2, 2)
+        dir_win.leaveok(True)
         dir_win.box()
         
         title = "Service Directories (a:add d:delete Enter:done)"
-        dir_win.addstr(1, 2, title[:width-8], curses.A_BOLD)
+        dir_win.addnstr(1, 2, title, width-8, curses.A_BOLD)
         dir_win.hline(2, 1, '-', width - 8)
         
         directories = config.get_service_directories()[:]
         selection = 0
         
         while True:
-            dir_win.clear()
+            if self._size != (height, width):
+                # Resized, here or in the text input opened from here
+                height, width = self._size
+                if width < 60 or height < 15:
+                    # Too small to edit in; keep the changes made so far
+                    config.config['service_directories'] = directories
+                    config.save_config()
+                    break
+                self.stdscr.noutrefresh()
+                dir_win.resize(height - 4, width - 4)
+            
+            dir_win.erase()
             dir_win.box()
-            dir_win.addstr(1, 2, title[:width-8], curses.A_BOLD)
+            dir_win.addnstr(1, 2, title, width-8, curses.A_BOLD)
             dir_win.hline(2, 1, '-', width - 8)
             
             for i, directory in enumerate(directories):
                 if 3 + i >= height - 6:
                     break
                 attr = curses.A_REVERSE if i == selection else 0
-                dir_win.addstr(3 + i, 3, directory[:width-10], attr)
+                dir_win.addnstr(3 + i, 3, directory, width-10, attr)
             
-            dir_win.refresh()
+            dir_win.noutrefresh()
+            curses.doupdate()
             key = dir_win.getch()
             
-            if key == ord('\n') or key == ord('\r') or key == 27:
+            if key == curses.KEY_RESIZE:
+                self.handle_resize()
+            elif key == ord('\n') or key == ord('\r') or key == 27:
                 # Save changes
                 config.config['service_directories'] = directories
                 config.save_config()
@@ -552,7 +866,7 @@ class TUI:
                 self.show_message("Invalid interval: must be a number", is_error=True)
     
     def get_text_input(self, prompt):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         input_height = 5
         input_width = min(60, width - 4)
@@ -561,16 +875,21 @@ class TUI:
         
         input_win = curses.newwin(input_height, input_width, start_y, start_x)
         input_win.box()
-        input_win.addstr(1, 2, prompt[:input_width-4])
+        input_win.addnstr(1, 2, prompt, input_width-4)
         input_win.addstr(3, 2, "> ")
         
         curses.curs_set(1)  # Show cursor
-        input_win.refresh()
+        input_win.noutrefresh()
+        curses.doupdate()
         
         text = ""
         while True:
+            # getch() refreshes the window itself, so no explicit refresh
             ch = input_win.getch()
-            if ch == ord('\n') or ch == ord('\r'):
+            if ch == curses.KEY_RESIZE:
+                # The box stays where it is; callers lay themselves out again
+                self.handle_resize()
+            elif ch == ord('\n') or ch == ord('\r'):
                 break
             elif ch == 27:  # ESC
                 text = ""
@@ -584,24 +903,22 @@ class TUI:
                 if len(text) < input_width - 6:
                     text += chr(ch)
                     input_win.addch(3, 4 + len(text) - 1, ch)
-            
-            input_win.refresh()
         
         curses.curs_set(0)  # Hide cursor
         return text.strip()
     
     def reset_config(self, config):
         if config.reset_to_defaults():
-            self.controller.reload_config()  # Reload controller with new config
+            self.reload_controller_config()
             self.show_brief_message("Configuration reset to defaults")
         else:
             self.show_message("Failed to reset configuration", is_error=True)
     
     def show_config_reload_message(self):
-        height, width = self.stdscr.getmaxyx()
+        height, width = self._size
         
         try:
-            self.stdscr.clear()
+            self.stdscr.erase()
             
             # Simple reload message
             reload_msg = "Configuration changed - reloading services..."
@@ -614,7 +931,8 @@ class TUI:
                 self.stdscr.addstr(height // 2 + 2, (width - len(spinner_msg)) // 2, 
                                  spinner_msg, curses.A_DIM)
             
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            curses.doupdate()
             
         except curses.error:
             pass
@@ -628,57 +946,156 @@ class TUI:
         
         try:
             self.stdscr.addstr(0, 0, f"Performing {action} on {service_name}...", curses.A_BOLD)
-            self.stdscr.refresh()
+            self.stdscr.noutrefresh()
+            curses.doupdate()
             
             success, output = self.controller.control_service(action, service_name)
+            # Logs opened next should show the result
+            self._log_cache = None
             
             if success:
                 self.show_brief_message(f"Service {service_name} {action}ed successfully")
-                self.refresh_services()
+                # An in-flight result is still used; run() starts another after it
+                self._refresh_requested = True
             else:
                 self.show_message(f"Error {action}ing {service_name}: {output}", is_error=True)
         
         except Exception as e:
             self.show_message(f"Error: {str(e)}", is_error=True)
+        
+        # The progress text was written over the header row
+        self._full_redraw = True
+    
+    def draw_frame(self, rows=None):
+        """Draw the main screen (or just the given service rows) and push it to the terminal"""
+        # Erase only when the layout may have changed
+        size = self._size
+        if self._full_redraw or size != self._drawn_size:
+            self.stdscr.erase()
+            self._row_cache = []
+            self._last_status = ''
+            self._header_drawn = False
+            self._full_redraw = False
+            self._drawn_size = size
+            # Everything was erased, so every row needs drawing
+            rows = None
+        
+        header_ok = self.draw_header()
+        
+        if header_ok:
+            self.draw_services(rows)
+            
+            height, width = size
+            if self._brief is not None:
+                status_line = self._brief[0]
+            else:
+                status_line = f"Services: {len(self.services)} | Selected: {self.current_selection + 1 if self.services else 0}"
+            if status_line != self._last_status:
+                try:
+                    self.stdscr.move(height - 1, 0)
+                    self.stdscr.clrtoeol()
+                    if self._brief is not None:
+                        self.stdscr.addnstr(height - 1, 2, status_line, width - 4,
+                                            curses.color_pair(1) | curses.A_BOLD)
+                    elif width > len(status_line) + 2:
+                        self.stdscr.addstr(height - 1, 2, status_line, curses.A_DIM)
+                    self._last_status = status_line
+                except curses.error:
+                    pass
+        else:
+            # The error screen replaced everything; redraw fully once it clears
+            self._full_redraw = True
+        
+        self.stdscr.noutrefresh()
+        if self._sync_output:
+            # The markers go straight to the terminal, around the flushed frame
+            os.write(1, SYNC_BEGIN)
+            curses.doupdate()
+            os.write(1, SYNC_END)
+        else:
+            curses.doupdate()
+        self._dirty = False
+    
+    def handle_resize(self):
+        """Pick up the new terminal size after getch() returned KEY_RESIZE"""
+        # ncurses has already resized stdscr; keep LINES/COLS and _size in step
+        curses.update_lines_cols()
+        self._size = self.stdscr.getmaxyx()
+        # Blank the old layout; the main screen is redrawn in full
+        self.stdscr.erase()
+        self._full_redraw = True
+        return self._size
+    
+    def resume_main_screen(self):
+        """Repaint the main screen after a popup, which may have swallowed a resize"""
+        self._size = self.stdscr.getmaxyx()
+        self.stdscr.touchwin()
+        self._dirty = True
     
     def run(self):
         # Show loading screen during initial service discovery
         if self.initial_load:
             self.show_loading_screen()
-        
-        self.refresh_services()
+            if not self.load_services_with_progress():
+                return
+        else:
+            self.refresh_services()
         self.initial_load = False
+        input_pending = False
         
         while True:
-            refresh_interval = self.controller.config.get_refresh_interval()
-            if time.time() - self.last_refresh > refresh_interval:
-                self.refresh_services()
+            # Periodic refreshes run in the background
+            self.finish_background_refresh()
+            refresh_interval = self._refresh_interval
+            now = time.time()
+            if self._refresh_requested or now - self.last_refresh > refresh_interval:
+                self.start_background_refresh()
             
-            self.stdscr.clear()
-            header_ok = self.draw_header()
+            if self._brief is not None and time.monotonic() >= self._brief[1]:
+                self._brief = None
+                self._dirty = True
             
-            if header_ok:
-                self.draw_services()
+            # Handle all queued keys before drawing
+            if input_pending:
+                self.stdscr.timeout(0)
+            else:
+                minute = int(now) // 60
+                if (self._dirty or self._full_redraw or self._size != self._drawn_size or
+                        minute != self._drawn_minute):
+                    self.draw_frame()
+                    self._drawn_minute = minute
+                elif self.current_selection != self._prev_selection:
+                    self.draw_frame(rows=(self._prev_selection, self.current_selection))
                 
-                height, width = self.stdscr.getmaxyx()
-                status_line = f"Services: {len(self.services)} | Selected: {self.current_selection + 1 if self.services else 0}"
-                try:
-                    if width > len(status_line) + 2:
-                        self.stdscr.addstr(height - 1, 2, status_line, curses.A_DIM)
-                except curses.error:
-                    pass
-            
-            self.stdscr.refresh()
+                # Wait for the next refresh or minute; poll while a refresh runs
+                if self._refresh_thread is not None:
+                    wait = 0.1
+                else:
+                    wait = min(self.last_refresh + refresh_interval, (minute + 1) * 60) - now
+                if self._brief is not None:
+                    wait = min(wait, self._brief[1] - time.monotonic())
+                self.stdscr.timeout(max(10, int(wait * 1000)))
             
             try:
                 key = self.stdscr.getch()
                 
+                if key == -1:
+                    input_pending = False
+                    continue
+                
+                input_pending = True
+                
                 if key == ord('q') or key == 27:  # q or ESC
                     break
                 
-                elif key == ord('r'):
-                    self.refresh_services()
+                elif key == curses.KEY_RESIZE:
+                    # The size change itself makes the next frame a full redraw
+                    self.handle_resize()
                 
+                elif key == ord('r'):
+                    if self._refresh_thread is None:
+                        self.controller.rebuild_service_index()
+                    self.start_background_refresh()
                 
                 elif key == curses.KEY_UP or key == ord('k'):
                     self.current_selection = max(0, self.current_selection - 1)
@@ -689,19 +1106,24 @@ class TUI:
                 elif key == ord(' '):  # space for status
                     if self.services and self.current_selection < len(self.services):
                         self.show_status_detail(self.services[self.current_selection])
+                        self.resume_main_screen()
                 
                 elif key == ord('s'):  # start
                     self.handle_service_action('start')
+                    self.resume_main_screen()
                 
                 elif key == ord('p'):  # stop
                     self.handle_service_action('stop')
+                    self.resume_main_screen()
                 
                 elif key == ord('e'):  # restart
                     self.handle_service_action('restart')
+                    self.resume_main_screen()
                 
                 elif key == ord('l'):  # logs
                     if self.services and self.current_selection < len(self.services):
                         self.show_service_logs(self.services[self.current_selection])
+                        self.resume_main_screen()
                 
                 elif key == ord('c'):  # config
                     old_config_hash = hash(str(self.controller.config.config))
@@ -710,8 +1132,11 @@ class TUI:
                     
                     # Force refresh if config changed
                     if old_config_hash != new_config_hash:
+                        self.load_settings()
                         self.show_config_reload_message()
                         self.refresh_services()
+                    self.resume_main_screen()
+                    self._full_redraw = True
             
             except KeyboardInterrupt:
                 break